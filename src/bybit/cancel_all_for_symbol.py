@@ -2,12 +2,13 @@
 """
 Отмена всех ордеров по символу (Bybit V5, деривативы linear).
 - Укажи SYMBOL ниже.
-- Скрипт считает открытые ордера, вызывает cancel_all, затем проверяет остаток.
+- Скрипт вызывает cancel_all и считает отменённые ордера по ответу биржи.
 - Итог: печатает число отменённых ордеров или ошибку.
 """
 
 import os
 import sys
+from functools import lru_cache
 from dotenv import load_dotenv
 from pybit.unified_trading import HTTP
 
@@ -17,6 +18,11 @@ SYMBOL = "BTCUSDT"
 def _str_to_bool(v: str | None) -> bool:
     return (v or "").strip().lower() in {"1","true","yes","y","on"}
 
+@lru_cache(maxsize=None)
+def _get_http(testnet: bool, api_key: str, api_secret: str) -> HTTP:
+    return HTTP(testnet=testnet, api_key=api_key, api_secret=api_secret,
+                timeout=10_000, recv_window=5_000)
+
 def cancel_all_for_symbol(symbol: str) -> int:
     """
     Отменяет все открытые ордера по symbol.
@@ -29,33 +35,16 @@ def cancel_all_for_symbol(symbol: str) -> int:
     if not api_key or not api_secret:
         raise RuntimeError("Нет BYBIT_API_KEY/BYBIT_API_SECRET в .env")
 
-    http = HTTP(testnet=testnet, api_key=api_key, api_secret=api_secret,
-                timeout=10_000, recv_window=5_000)
-
-    # 1) Сколько ордеров открыто сейчас
-    r_before = http.get_open_orders(category="linear", symbol=symbol)
-    if not isinstance(r_before, dict) or r_before.get("retCode") != 0:
-        raise RuntimeError(f"Bybit API error (get_open_orders): {r_before}")
-    before_list = r_before.get("result", {}).get("list") or []
-    before_cnt = len(before_list)
-
-    if before_cnt == 0:
-        return 0
+    http = _get_http(testnet, api_key, api_secret)
 
-    # 2) Отменяем все
+    # Отменяем все (включая условные). Биржа сама возвращает список
+    # отменённых ордеров, так что отдельные запросы до/после не нужны.
     r_cancel = http.cancel_all_orders(category="linear", symbol=symbol)
     if not isinstance(r_cancel, dict) or r_cancel.get("retCode") != 0:
         raise RuntimeError(f"Bybit API error (cancel_all_orders): {r_cancel}")
 
-    # 3) Проверяем остаток
-    r_after = http.get_open_orders(category="linear", symbol=symbol)
-    if not isinstance(r_after, dict) or r_after.get("retCode") != 0:
-        raise RuntimeError(f"Bybit API error (get_open_orders after): {r_after}")
-    after_list = r_after.get("result", {}).get("list") or []
-    after_cnt = len(after_list)
-
-    cancelled = max(0, before_cnt - after_cnt)
-    return cancelled
+    cancelled_list = r_cancel.get("result", {}).get("list") or []
+    return len(cancelled_list)
 
 if __name__ == "__main__":
     try:
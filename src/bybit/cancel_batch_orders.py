@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+Пакетная отмена ордеров по списку ID (Bybit V5, /v5/order/cancel-batch).
+- Работает на линейных фьючерсах (category="linear").
+- Ключи читаются из .env.
+- Биржа принимает до 20 ордеров за запрос — длинный список режется на пачки.
+- Итог: печатает "SUCCESS <orderId>" или "ERROR <orderId> <msg>" по каждому ордеру.
+"""
+
+import os
+import sys
+from functools import lru_cache
+from dotenv import load_dotenv
+from pybit.unified_trading import HTTP
+
+# 🔧 Символ и полные ID ордеров
+SYMBOL = "BTCUSDT"
+ORDER_IDS = ["32bc732f-9064-4750-83f7-924d9bb3f1d2"]
+
+BATCH_LIMIT = 20  # максимум ордеров в одном batch-запросе для linear
+
+
+def _str_to_bool(v: str | None) -> bool:
+    return (v or "").strip().lower() in {"1", "true", "yes", "y", "on"}
+
+
+@lru_cache(maxsize=None)
+def _get_http(testnet: bool, api_key: str, api_secret: str) -> HTTP:
+    return HTTP(testnet=testnet, api_key=api_key, api_secret=api_secret,
+                timeout=10_000, recv_window=5_000)
+
+
+def cancel_batch_orders(symbol: str, order_ids: list[str]) -> list[tuple[str | None, str]]:
+    """
+    Отменяет ордера по списку полных orderId.
+    Возвращает список (orderId, msg) в том же порядке, что и order_ids:
+    orderId — если биржа подтвердила отмену, None — если нет (msg — причина).
+    Ошибка одной пачки не прерывает остальные: её ордера попадают в результат
+    как (None, <причина>), подтверждения по уже отправленным пачкам сохраняются.
+    """
+    load_dotenv()
+    api_key = os.getenv("BYBIT_API_KEY")
+    api_secret = os.getenv("BYBIT_API_SECRET")
+    testnet = _str_to_bool(os.getenv("BYBIT_TESTNET"))
+    if not api_key or not api_secret:
+        raise RuntimeError("Нет BYBIT_API_KEY/BYBIT_API_SECRET в .env")
+
+    http = _get_http(testnet, api_key, api_secret)
+
+    results_out: list[tuple[str | None, str]] = []
+    for start in range(0, len(order_ids), BATCH_LIMIT):
+        request = [{"symbol": symbol, "orderId": oid}
+                   for oid in order_ids[start:start + BATCH_LIMIT]]
+
+        try:
+            resp = http.cancel_batch_order(category="linear", request=request)
+        except Exception as exc:
+            results_out.extend((None, f"Bybit API error (cancel batch): {exc}") for _ in request)
+            continue
+        if not isinstance(resp, dict) or resp.get("retCode") != 0:
+            err = resp.get("retMsg") if isinstance(resp, dict) else None
+            results_out.extend((None, f"Bybit API error (cancel batch): {err or resp}")
+                               for _ in request)
+            continue
+
+        # result.list и retExtInfo.list идут в порядке request;
+        # ордер уже исполнен/отменён — биржа вернёт для него code != 0
+        results = resp.get("result", {}).get("list") or []
+        statuses = resp.get("retExtInfo", {}).get("list") or []
+        for i in range(len(request)):
+            status = statuses[i] if i < len(statuses) else {}
+            code = status.get("code", 0)
+            msg = status.get("msg") or "OK"
+            oid = results[i].get("orderId") if i < len(results) else None
+            results_out.append((oid if code == 0 and oid else None, msg))
+
+    return results_out
+
+
+if __name__ == "__main__":
+    try:
+        for requested, (oid, msg) in zip(ORDER_IDS, cancel_batch_orders(SYMBOL, ORDER_IDS)):
+            print(f"SUCCESS {oid}" if oid else f"ERROR {requested} {msg}")
+    except Exception as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        sys.exit(1)
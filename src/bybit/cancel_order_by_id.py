@@ -9,6 +9,7 @@
 
 import os
 import sys
+from functools import lru_cache
 from dotenv import load_dotenv
 from pybit.unified_trading import HTTP
 
@@ -19,6 +20,11 @@ ORDER_ID = "42fae275"  # полный UUID или последние 8 симв
 def _str_to_bool(v: str | None) -> bool:
     return (v or "").strip().lower() in {"1","true","yes","y","on"}
 
+@lru_cache(maxsize=None)
+def _get_http(testnet: bool, api_key: str, api_secret: str) -> HTTP:
+    return HTTP(testnet=testnet, api_key=api_key, api_secret=api_secret,
+                timeout=10_000, recv_window=5_000)
+
 def _is_tail(s: str) -> bool:
     s = (s or "").strip()
     return len(s) == 8 and all(ch in "0123456789abcdefABCDEF" for ch in s)
@@ -39,21 +45,31 @@ def cancel_order_by_id(symbol: str, order_id: str) -> str | None:
     if not api_key or not api_secret:
         raise RuntimeError("Нет BYBIT_API_KEY/BYBIT_API_SECRET в .env")
 
-    http = HTTP(testnet=testnet, api_key=api_key, api_secret=api_secret,
-                timeout=10_000, recv_window=5_000)
+    http = _get_http(testnet, api_key, api_secret)
 
     full_id = order_id
 
     # Если передан хвост из 8 символов — найдём полный ID среди открытых ордеров
     if _is_tail(order_id):
-        r = http.get_open_orders(category="linear", symbol=symbol)
-        if not isinstance(r, dict) or r.get("retCode") != 0:
-            raise RuntimeError(f"Bybit API error (open): {r}")
         found_full_id = None
-        for order in r.get("result", {}).get("list") or []:
-            candidate_id = order.get("orderId", "")
-            if _match(order_id, candidate_id):
-                found_full_id = candidate_id
+        cursor = None
+        pages = 0
+        while not found_full_id and pages < 10:  # лимит страниц на всякий случай
+            kwargs = {"category": "linear", "symbol": symbol, "limit": 50}
+            if cursor:
+                kwargs["cursor"] = cursor
+            r = http.get_open_orders(**kwargs)
+            if not isinstance(r, dict) or r.get("retCode") != 0:
+                raise RuntimeError(f"Bybit API error (open): {r}")
+            items = r.get("result", {}).get("list") or []
+            for order in items:
+                candidate_id = order.get("orderId", "")
+                if _match(order_id, candidate_id):
+                    found_full_id = candidate_id
+                    break
+            cursor = r.get("result", {}).get("nextPageCursor")
+            pages += 1
+            if not cursor or len(items) < 50:
                 break
         if not found_full_id:
             return None
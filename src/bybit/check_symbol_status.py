@@ -10,26 +10,42 @@
 
 import os
 import sys
+import time
+from functools import lru_cache
 from dotenv import load_dotenv
 from pybit.unified_trading import HTTP
 
 # 🔧 Здесь задаём проверяемый символ
 SYMBOL = "BTCUSDT"
 
+# Статус может смениться (Trading -> Settling), поэтому TTL короче, чем у фильтров
+CACHE_TTL = 60  # секунд
+_cache: dict[tuple[bool, str], tuple[float, tuple[bool, str]]] = {}  # ключ: (testnet, symbol)
+
 
 def _str_to_bool(v: str | None) -> bool:
     return (v or "").strip().lower() in {"1", "true", "yes", "y", "on"}
 
 
+@lru_cache(maxsize=None)
+def _get_http(testnet: bool) -> HTTP:
+    return HTTP(testnet=testnet, timeout=10_000, recv_window=5_000)
+
+
 def check_symbol_status(symbol: str) -> tuple[bool, str]:
     """
     Проверяет статус символа на Bybit.
     Возвращает (is_trading: bool, status: str).
+    Результат кешируется на CACHE_TTL секунд.
     """
     load_dotenv()
     testnet = _str_to_bool(os.getenv("BYBIT_TESTNET"))
 
-    http = HTTP(testnet=testnet, timeout=10_000, recv_window=5_000)
+    cached = _cache.get((testnet, symbol))
+    if cached and time.monotonic() - cached[0] < CACHE_TTL:
+        return cached[1]
+
+    http = _get_http(testnet)
 
     resp = http.get_instruments_info(category="linear", symbol=symbol)
 
@@ -41,7 +57,20 @@ def check_symbol_status(symbol: str) -> tuple[bool, str]:
         return False, "NotFound"
 
     status = instruments[0].get("status", "Unknown")
-    return status == "Trading", status
+    result = (status == "Trading", status)
+    _cache[(testnet, symbol)] = (time.monotonic(), result)
+    return result
+
+
+def invalidate(symbol: str | None = None) -> None:
+    """
+    Сбрасывает кеш статуса для symbol в обеих сетях (или целиком, если symbol не задан).
+    """
+    if symbol is None:
+        _cache.clear()
+        return
+    for testnet in (False, True):
+        _cache.pop((testnet, symbol), None)
 
 
 if __name__ == "__main__":
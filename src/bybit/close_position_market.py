@@ -8,7 +8,10 @@
 
 import os
 import sys
-import uuid
+import itertools
+import secrets
+import time
+from functools import lru_cache
 from dotenv import load_dotenv
 from pybit.unified_trading import HTTP
 
@@ -16,9 +19,24 @@ from pybit.unified_trading import HTTP
 SYMBOL = "BTCUSDT"
 SIDE = "long"   # "long" или "short"
 
+# long закрывается продажей позиции Buy, short — покупкой позиции Sell
+_SIDE_TO_POS = {"long": "buy", "short": "sell"}
+_SIDE_TO_ORDER = {"long": "Sell", "short": "Buy"}
+
+_LINK_ID_CTR = itertools.count()
+_LINK_ID_BASE = f"{int(time.time()):x}{secrets.token_hex(2)}"
+
 def _str_to_bool(v: str | None) -> bool:
     return (v or "").strip().lower() in {"1", "true", "yes", "y", "on"}
 
+def _link_id(prefix: str) -> str:
+    return f"{prefix}-{_LINK_ID_BASE}{next(_LINK_ID_CTR):x}"
+
+@lru_cache(maxsize=None)
+def _get_http(testnet: bool, api_key: str, api_secret: str) -> HTTP:
+    return HTTP(testnet=testnet, api_key=api_key, api_secret=api_secret,
+                timeout=10_000, recv_window=5_000)
+
 def close_position_market(symbol: str, side: str) -> str | None:
     load_dotenv()
     api_key = os.getenv("BYBIT_API_KEY")
@@ -28,11 +46,11 @@ def close_position_market(symbol: str, side: str) -> str | None:
     if not api_key or not api_secret:
         raise RuntimeError("Нет ключей BYBIT_API_KEY/BYBIT_API_SECRET в .env")
 
-    http = HTTP(testnet=testnet, api_key=api_key, api_secret=api_secret,
-                timeout=10_000, recv_window=5_000)
+    http = _get_http(testnet, api_key, api_secret)
 
     side = side.lower().strip()
-    if side not in {"long", "short"}:
+    want_pos = _SIDE_TO_POS.get(side)
+    if want_pos is None:
         raise ValueError("SIDE должен быть 'long' или 'short'")
 
     # 1) Получаем позиции по символу
@@ -47,14 +65,7 @@ def close_position_market(symbol: str, side: str) -> str | None:
     # One-Way   : обычно одна запись с positionIdx=0/1 и side Buy/Sell в зависимости от направления
     target = None
     for p in items:
-        p_side = (p.get("side") or "").lower()
-        p_size = float(p.get("size", "0") or "0")
-        if p_size == 0:
-            continue
-        if side == "long" and p_side == "buy":
-            target = p
-            break
-        if side == "short" and p_side == "sell":
+        if (p.get("side") or "").lower() == want_pos and float(p.get("size", "0") or "0") != 0:
             target = p
             break
 
@@ -65,7 +76,7 @@ def close_position_market(symbol: str, side: str) -> str | None:
     pos_idx = int(target.get("positionIdx", 0))
 
     # 2) Формируем ордер на закрытие
-    order_side = "Sell" if side == "long" else "Buy"
+    order_side = _SIDE_TO_ORDER[side]
     order_args = dict(
         category="linear",
         symbol=symbol,
@@ -74,7 +85,7 @@ def close_position_market(symbol: str, side: str) -> str | None:
         qty=qty,
         timeInForce="IOC",
         reduceOnly=True,
-        orderLinkId=f"close-{uuid.uuid4().hex[:10]}",
+        orderLinkId=_link_id("close"),
     )
 
     # В Hedge-режиме ОБЯЗАТЕЛЕН корректный positionIdx (1 для long, 2 для short)
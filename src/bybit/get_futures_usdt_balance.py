@@ -9,6 +9,7 @@ from __future__ import annotations
 from decimal import Decimal, ROUND_HALF_UP
 import os
 import sys
+from functools import lru_cache
 
 from dotenv import load_dotenv
 from pybit.unified_trading import HTTP
@@ -20,6 +21,12 @@ def _str_to_bool(v: str | None) -> bool:
     return v.strip().lower() in {"1", "true", "yes", "y", "on"}
 
 
+@lru_cache(maxsize=None)
+def _get_http(testnet: bool, api_key: str, api_secret: str) -> HTTP:
+    return HTTP(testnet=testnet, api_key=api_key, api_secret=api_secret,
+                timeout=10_000, recv_window=5_000)
+
+
 def get_futures_usdt_balance() -> float:
     """
     Возвращает баланс USDT (Unified/Futures), округлённый до 2 знаков.
@@ -33,13 +40,7 @@ def get_futures_usdt_balance() -> float:
     if not api_key or not api_secret:
         raise RuntimeError("Отсутствуют BYBIT_API_KEY/BYBIT_API_SECRET в .env")
 
-    http = HTTP(
-        testnet=testnet,
-        api_key=api_key,
-        api_secret=api_secret,
-        timeout=10_000,
-        recv_window=5_000,
-    )
+    http = _get_http(testnet, api_key, api_secret)
 
     # Запрашиваем баланс Unified-аккаунта по USDT
     resp = http.get_wallet_balance(accountType="UNIFIED", coin="USDT")
@@ -9,6 +9,7 @@
 
 import os
 import sys
+from functools import lru_cache
 from dotenv import load_dotenv
 from pybit.unified_trading import HTTP
 
@@ -18,6 +19,11 @@ SYMBOL = "BTCUSDT"
 def _str_to_bool(v: str | None) -> bool:
     return (v or "").strip().lower() in {"1", "true", "yes", "y", "on"}
 
+@lru_cache(maxsize=None)
+def _get_http(testnet: bool, api_key: str, api_secret: str) -> HTTP:
+    return HTTP(testnet=testnet, api_key=api_key, api_secret=api_secret,
+                timeout=10_000, recv_window=5_000)
+
 def get_open_orders(symbol: str) -> list[dict]:
     """
     Возвращает список открытых ордеров (включая условные).
@@ -30,15 +36,30 @@ def get_open_orders(symbol: str) -> list[dict]:
     if not api_key or not api_secret:
         raise RuntimeError("Нет ключей BYBIT_API_KEY/BYBIT_API_SECRET в .env")
 
-    http = HTTP(testnet=testnet, api_key=api_key, api_secret=api_secret,
-                timeout=10_000, recv_window=5_000)
+    http = _get_http(testnet, api_key, api_secret)
+
+    # limit=50 — максимум страницы; остальное добираем по nextPageCursor
+    orders: list[dict] = []
+    cursor = None
+    pages = 0
+    while pages < 10:  # лимит страниц на всякий случай
+        kwargs = {"category": "linear", "symbol": symbol, "limit": 50}
+        if cursor:
+            kwargs["cursor"] = cursor
 
-    resp = http.get_open_orders(category="linear", symbol=symbol)
+        resp = http.get_open_orders(**kwargs)
+        if not isinstance(resp, dict) or resp.get("retCode") != 0:
+            raise RuntimeError(f"Bybit API error: {resp}")
 
-    if not isinstance(resp, dict) or resp.get("retCode") != 0:
-        raise RuntimeError(f"Bybit API error: {resp}")
+        items = resp["result"]["list"] or []
+        orders.extend(items)
+        cursor = resp["result"].get("nextPageCursor")
+        pages += 1
+        # Неполная страница — последняя, лишний запрос не нужен
+        if not cursor or len(items) < 50:
+            break
 
-    return resp["result"]["list"] or []
+    return orders
 
 if __name__ == "__main__":
     try:
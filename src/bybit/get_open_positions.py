@@ -9,6 +9,7 @@
 
 import os
 import sys
+from functools import lru_cache
 from dotenv import load_dotenv
 from pybit.unified_trading import HTTP
 
@@ -18,6 +19,11 @@ SYMBOL = "BTCUSDT"
 def _str_to_bool(v: str | None) -> bool:
     return (v or "").strip().lower() in {"1", "true", "yes", "y", "on"}
 
+@lru_cache(maxsize=None)
+def _get_http(testnet: bool, api_key: str, api_secret: str) -> HTTP:
+    return HTTP(testnet=testnet, api_key=api_key, api_secret=api_secret,
+                timeout=10_000, recv_window=5_000)
+
 def get_open_positions(symbol: str) -> list[dict]:
     """
     Возвращает список позиций по символу.
@@ -31,8 +37,7 @@ def get_open_positions(symbol: str) -> list[dict]:
     if not api_key or not api_secret:
         raise RuntimeError("Нет BYBIT_API_KEY/BYBIT_API_SECRET в .env")
 
-    http = HTTP(testnet=testnet, api_key=api_key, api_secret=api_secret,
-                timeout=10_000, recv_window=5_000)
+    http = _get_http(testnet, api_key, api_secret)
 
     resp = http.get_positions(category="linear", symbol=symbol)
 
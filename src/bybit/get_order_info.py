@@ -9,6 +9,7 @@
 
 import os
 import sys
+from functools import lru_cache
 from dotenv import load_dotenv
 from pybit.unified_trading import HTTP
 
@@ -19,6 +20,11 @@ ORDER_ID = "8730b59c"
 def _str_to_bool(v: str | None) -> bool:
     return (v or "").strip().lower() in {"1","true","yes","y","on"}
 
+@lru_cache(maxsize=None)
+def _get_http(testnet: bool, api_key: str, api_secret: str) -> HTTP:
+    return HTTP(testnet=testnet, api_key=api_key, api_secret=api_secret,
+                timeout=10_000, recv_window=5_000)
+
 def _is_tail_id(s: str) -> bool:
     s = (s or "").strip()
     return len(s) == 8 and all(ch in "0123456789abcdefABCDEF" for ch in s)
@@ -36,36 +42,65 @@ def get_order_info(symbol: str, order_id: str) -> dict | None:
     if not api_key or not api_secret:
         raise RuntimeError("Нет BYBIT_API_KEY/BYBIT_API_SECRET в .env")
 
-    http = HTTP(testnet=testnet, api_key=api_key, api_secret=api_secret,
-                timeout=10_000, recv_window=5_000)
+    http = _get_http(testnet, api_key, api_secret)
+
+    # Bybit хранит orderId в нижнем регистре — приводим ввод к тому же виду,
+    # чтобы точный серверный фильтр orderId находил ордер
+    order_id = (order_id or "").strip().lower()
+    is_full_id = not _is_tail_id(order_id) and len(order_id) > 8
 
     # ---------- 1) Пытаемся найти среди ОТКРЫТЫХ ордеров по symbol ----------
     # Если ID полный — попробуем прямой фильтр, это быстрее
-    if not _is_tail_id(order_id) and len(order_id) > 8:
-        r = http.get_open_orders(category="linear", symbol=symbol, orderId=order_id)
+    direct_ok = False
+    if is_full_id:
+        r = http.get_open_orders(category="linear", symbol=symbol, orderId=order_id, limit=1)
         if isinstance(r, dict) and r.get("retCode") == 0:
             items = r.get("result", {}).get("list") or []
             if items:
                 return items[0]
+            # Фильтр отработал и ничего не нашёл — полный список тоже не найдёт
+            direct_ok = True
 
     # Иначе берём весь список по symbol и ищем совпадение по хвосту/полю
-    r = http.get_open_orders(category="linear", symbol=symbol)
-    if not isinstance(r, dict) or r.get("retCode") != 0:
-        raise RuntimeError(f"Bybit API error (open): {r}")
-    for o in r.get("result", {}).get("list") or []:
-        if _id_match(order_id, o.get("orderId", "")):
-            return o
-
-    # ---------- 2) Ищем в ИСТОРИИ с пагинацией ----------
-    # Если ID полный — используем фильтр orderId (сервер сам найдёт быстрее)
+    cursor = None
+    pages = 0
+    while not direct_ok and pages < 10:  # лимит страниц на всякий случай
+        kwargs = {"category": "linear", "symbol": symbol, "limit": 50}
+        if cursor:
+            kwargs["cursor"] = cursor
+        r = http.get_open_orders(**kwargs)
+        if not isinstance(r, dict) or r.get("retCode") != 0:
+            raise RuntimeError(f"Bybit API error (open): {r}")
+        items = r.get("result", {}).get("list") or []
+        for o in items:
+            if _id_match(order_id, o.get("orderId", "")):
+                return o
+        cursor = r.get("result", {}).get("nextPageCursor")
+        pages += 1
+        if not cursor or len(items) < 50:
+            break
+
+    # ---------- 2) Ищем в ИСТОРИИ ----------
+    # Если ID полный — фильтр orderId на сервере отдаёт ордер за один запрос.
+    # Пустой ответ значит, что в недавней истории ордера нет: страницы не листаем.
+    if is_full_id:
+        r_hist = http.get_order_history(category="linear", symbol=symbol,
+                                        orderId=order_id, limit=1)
+        if not isinstance(r_hist, dict) or r_hist.get("retCode") != 0:
+            raise RuntimeError(f"Bybit API error (history): {r_hist}")
+        items = r_hist.get("result", {}).get("list") or []
+        return items[0] if items else None
+
+    # Хвост — только перебор страниц (курсор следующей страницы известен
+    # лишь из ответа предыдущей, поэтому параллельно их не запросить).
+    # Фильтр orderStatus не ставим: статус искомого ордера заранее неизвестен,
+    # а биржа принимает только один статус за запрос
     cursor = None
     pages = 0
     while pages < 10:  # лимит страниц на всякий случай
-        kwargs = {"category": "linear", "symbol": symbol}
+        kwargs = {"category": "linear", "symbol": symbol, "limit": 50}
         if cursor:
             kwargs["cursor"] = cursor
-        if not _is_tail_id(order_id) and len(order_id) > 8:
-            kwargs["orderId"] = order_id
 
         r_hist = http.get_order_history(**kwargs)
         if not isinstance(r_hist, dict) or r_hist.get("retCode") != 0:
@@ -78,7 +113,7 @@ def get_order_info(symbol: str, order_id: str) -> dict | None:
 
         cursor = r_hist.get("result", {}).get("nextPageCursor")
         pages += 1
-        if not cursor:
+        if not cursor or len(items) < 50:
             break
 
     return None
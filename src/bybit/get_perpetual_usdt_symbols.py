@@ -7,6 +7,7 @@
 
 import os
 import sys
+from functools import lru_cache
 from dotenv import load_dotenv
 from pybit.unified_trading import HTTP
 
@@ -15,6 +16,11 @@ def _str_to_bool(v: str | None) -> bool:
     return (v or "").strip().lower() in {"1", "true", "yes", "y", "on"}
 
 
+@lru_cache(maxsize=None)
+def _get_http(testnet: bool) -> HTTP:
+    return HTTP(testnet=testnet, timeout=10_000, recv_window=5_000)
+
+
 def get_perpetual_usdt_symbols() -> list[str]:
     """
     Возвращает список символов линейных БЕССРОЧНЫХ фьючерсов USDT.
@@ -22,7 +28,7 @@ def get_perpetual_usdt_symbols() -> list[str]:
     load_dotenv()
     testnet = _str_to_bool(os.getenv("BYBIT_TESTNET"))
 
-    http = HTTP(testnet=testnet, timeout=10_000, recv_window=5_000)
+    http = _get_http(testnet)
 
     resp = http.get_instruments_info(category="linear")
 
@@ -7,6 +7,7 @@
 import os
 import sys
 import time
+from functools import lru_cache
 from dotenv import load_dotenv
 from pybit.unified_trading import HTTP
 
@@ -15,6 +16,11 @@ def _str_to_bool(v: str | None) -> bool:
     return (v or "").strip().lower() in {"1", "true", "yes", "y", "on"}
 
 
+@lru_cache(maxsize=None)
+def _get_http(testnet: bool) -> HTTP:
+    return HTTP(testnet=testnet, timeout=10_000, recv_window=5_000)
+
+
 def get_ping_server() -> float:
     """
     Делает запрос к Bybit /market/time, возвращает латентность (мс).
@@ -23,7 +29,7 @@ def get_ping_server() -> float:
     load_dotenv()
     testnet = _str_to_bool(os.getenv("BYBIT_TESTNET"))
 
-    http = HTTP(testnet=testnet, timeout=10_000, recv_window=5_000)
+    http = _get_http(testnet)
 
     t0 = time.perf_counter()
     resp = http.get_server_time()
@@ -9,6 +9,7 @@
 
 import os
 import sys
+from functools import lru_cache
 from dotenv import load_dotenv
 from pybit.unified_trading import HTTP
 
@@ -16,9 +17,16 @@ from pybit.unified_trading import HTTP
 SYMBOL = "BTCUSDT"
 SIDE = "short"   # варианты: "long" или "short"
 
+_SIDE_IDX = {"long": 1, "short": 2}
+
 def _str_to_bool(v: str | None) -> bool:
     return (v or "").strip().lower() in {"1", "true", "yes", "y", "on"}
 
+@lru_cache(maxsize=None)
+def _get_http(testnet: bool, api_key: str, api_secret: str) -> HTTP:
+    return HTTP(testnet=testnet, api_key=api_key, api_secret=api_secret,
+                timeout=10_000, recv_window=5_000)
+
 def get_position_side_for_hedg(symbol: str, side: str) -> dict | None:
     """
     Возвращает позицию для конкретной стороны (long/short) или None.
@@ -31,25 +39,22 @@ def get_position_side_for_hedg(symbol: str, side: str) -> dict | None:
     if not api_key or not api_secret:
         raise RuntimeError("Нет ключей BYBIT_API_KEY/BYBIT_API_SECRET в .env")
 
-    http = HTTP(testnet=testnet, api_key=api_key, api_secret=api_secret,
-                timeout=10_000, recv_window=5_000)
+    idx = _SIDE_IDX.get(side.lower())
+    if idx is None:
+        raise ValueError("side должен быть 'long' или 'short'")
+
+    http = _get_http(testnet, api_key, api_secret)
 
     resp = http.get_positions(category="linear", symbol=symbol)
     if not isinstance(resp, dict) or resp.get("retCode") != 0:
         raise RuntimeError(f"Bybit API error: {resp}")
 
     items = resp["result"]["list"] or []
+    by_idx = {int(p.get("positionIdx", 0)): p for p in items}
 
-    idx_map = {"long": 1, "short": 2}
-    idx = idx_map.get(side.lower())
-    if idx is None:
-        raise ValueError("side должен быть 'long' или 'short'")
-
-    for p in items:
-        if int(p.get("positionIdx", 0)) == idx:
-            if float(p.get("size", "0")) != 0:  # открытая позиция
-                return p
-            break
+    p = by_idx.get(idx)
+    if p is not None and float(p.get("size", "0")) != 0:  # открытая позиция
+        return p
     return None
 
 if __name__ == "__main__":
@@ -9,6 +9,7 @@
 
 import os
 import sys
+from functools import lru_cache
 from dotenv import load_dotenv
 from pybit.unified_trading import HTTP
 
@@ -20,6 +21,11 @@ def _str_to_bool(v: str | None) -> bool:
     return (v or "").strip().lower() in {"1", "true", "yes", "y", "on"}
 
 
+@lru_cache(maxsize=None)
+def _get_http(testnet: bool) -> HTTP:
+    return HTTP(testnet=testnet, timeout=10_000, recv_window=5_000)
+
+
 def get_summary_information_ticker(symbol: str) -> dict:
     """
     Возвращает словарь с данными 24h по символу.
@@ -27,7 +33,7 @@ def get_summary_information_ticker(symbol: str) -> dict:
     load_dotenv()
     testnet = _str_to_bool(os.getenv("BYBIT_TESTNET"))
 
-    http = HTTP(testnet=testnet, timeout=10_000, recv_window=5_000)
+    http = _get_http(testnet)
 
     resp = http.get_tickers(category="linear", symbol=symbol)
 
@@ -12,25 +12,41 @@
 
 import os
 import sys
+import time
+from functools import lru_cache
 from dotenv import load_dotenv
 from pybit.unified_trading import HTTP
 
 # 🔧 Символ указываем здесь
 SYMBOL = "BTCUSDT"
 
+# Фильтры меняются редко (часы-дни) — держим их в памяти процесса
+CACHE_TTL = 3600  # секунд
+_cache: dict[tuple[bool, str], tuple[float, dict]] = {}  # ключ: (testnet, symbol)
+
 
 def _str_to_bool(v: str | None) -> bool:
     return (v or "").strip().lower() in {"1", "true", "yes", "y", "on"}
 
 
+@lru_cache(maxsize=None)
+def _get_http(testnet: bool) -> HTTP:
+    return HTTP(testnet=testnet, timeout=10_000, recv_window=5_000)
+
+
 def get_symbol_filters(symbol: str) -> dict:
     """
     Возвращает объект фильтров для символа: {qty_step, min_qty, max_qty, tick_size}.
+    Результат кешируется на CACHE_TTL секунд.
     """
     load_dotenv()
     testnet = _str_to_bool(os.getenv("BYBIT_TESTNET"))
 
-    http = HTTP(testnet=testnet, timeout=10_000, recv_window=5_000)
+    cached = _cache.get((testnet, symbol))
+    if cached and time.monotonic() - cached[0] < CACHE_TTL:
+        return dict(cached[1])
+
+    http = _get_http(testnet)
 
     resp = http.get_instruments_info(category="linear", symbol=symbol)
 
@@ -45,12 +61,25 @@ def get_symbol_filters(symbol: str) -> dict:
     lot = inst.get("lotSizeFilter", {})
     price = inst.get("priceFilter", {})
 
-    return {
+    filters = {
         "qty_step": lot.get("qtyStep"),
         "min_qty": lot.get("minOrderQty"),
         "max_qty": lot.get("maxOrderQty"),
         "tick_size": price.get("tickSize"),
     }
+    _cache[(testnet, symbol)] = (time.monotonic(), filters)
+    return dict(filters)
+
+
+def invalidate(symbol: str | None = None) -> None:
+    """
+    Сбрасывает кеш фильтров для symbol в обеих сетях (или целиком, если symbol не задан).
+    """
+    if symbol is None:
+        _cache.clear()
+        return
+    for testnet in (False, True):
+        _cache.pop((testnet, symbol), None)
 
 
 if __name__ == "__main__":
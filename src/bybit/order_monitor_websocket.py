@@ -60,7 +60,8 @@ class OrderMonitor:
 
     def _on_open(self, ws):
         """Обработчик открытия WebSocket соединения"""
-        print(f"[{self._get_timestamp()}] WebSocket соединение установлено")
+        ts = self._get_timestamp()
+        print(f"[{ts}] WebSocket соединение установлено")
 
         # Аутентификация
         expires = int((time.time() + 10) * 1000)
@@ -72,7 +73,7 @@ class OrderMonitor:
         }
 
         ws.send(json.dumps(auth_message))
-        print(f"[{self._get_timestamp()}] Отправлена аутентификация")
+        print(f"[{ts}] Отправлена аутентификация")
 
     def _on_message(self, ws, message):
         """Обработчик сообщений WebSocket"""
@@ -81,7 +82,8 @@ class OrderMonitor:
 
             # Проверяем успешную аутентификацию
             if data.get("op") == "auth" and data.get("success"):
-                print(f"[{self._get_timestamp()}] Аутентификация успешна")
+                ts = self._get_timestamp()
+                print(f"[{ts}] Аутентификация успешна")
 
                 # Подписываемся на канал order
                 subscribe_message = {
@@ -89,14 +91,15 @@ class OrderMonitor:
                     "args": ["order"]
                 }
                 ws.send(json.dumps(subscribe_message))
-                print(f"[{self._get_timestamp()}] Подписка на канал 'order' отправлена")
+                print(f"[{ts}] Подписка на канал 'order' отправлена")
                 return
 
             # Подтверждение подписки
             if data.get("op") == "subscribe" and data.get("success"):
-                print(f"[{self._get_timestamp()}] Успешная подписка на канал 'order'")
-                print(f"[{self._get_timestamp()}] Мониторинг ордеров для {self.symbol} запущен...")
-                print(f"[{self._get_timestamp()}] Отслеживаемые Order IDs: {list(self.order_ids)}")
+                ts = self._get_timestamp()
+                print(f"[{ts}] Успешная подписка на канал 'order'")
+                print(f"[{ts}] Мониторинг ордеров для {self.symbol} запущен...")
+                print(f"[{ts}] Отслеживаемые Order IDs: {list(self.order_ids)}")
                 return
 
             # Обработка данных ордеров
@@ -111,25 +114,24 @@ class OrderMonitor:
     def _process_order_data(self, orders_data):
         """Обработка данных ордеров"""
         for order in orders_data:
-            symbol = order.get("symbol", "")
+            # Сначала самый избирательный фильтр: канал 'order' шлёт все ордеры
+            # аккаунта, а отслеживаем мы лишь несколько ID
             order_id = order.get("orderId", "")
-            order_status = order.get("orderStatus", "")
+            if order_id not in self.order_ids or order_id in self.filled_orders:
+                continue
 
-            # Фильтруем только нужный символ, отслеживаемые ордеры и исполненные статусы
-            if (symbol == self.symbol and
-                    order_id in self.order_ids and
-                    order_status == "Filled" and
-                    order_id not in self.filled_orders):
+            # Фильтруем только нужный символ и исполненный статус
+            if order.get("orderStatus") == "Filled" and order.get("symbol") == self.symbol:
 
                 self._log_filled_order(order)
                 self.filled_orders.add(order_id)
 
                 # Проверяем, все ли ордеры исполнены
                 if len(self.filled_orders) == len(self.order_ids):
-                    print(f"\n[{self._get_timestamp()}] 🎉 ВСЕ ОТСЛЕЖИВАЕМЫЕ ОРДЕРЫ ИСПОЛНЕНЫ!")
-                    print(
-                        f"[{self._get_timestamp()}] Исполнено: {len(self.filled_orders)}/{len(self.order_ids)} ордеров")
-                    print(f"[{self._get_timestamp()}] Завершение мониторинга...")
+                    ts = self._get_timestamp()
+                    print(f"\n[{ts}] 🎉 ВСЕ ОТСЛЕЖИВАЕМЫЕ ОРДЕРЫ ИСПОЛНЕНЫ!")
+                    print(f"[{ts}] Исполнено: {len(self.filled_orders)}/{len(self.order_ids)} ордеров")
+                    print(f"[{ts}] Завершение мониторинга...")
                     self.ws.close()
 
     def _log_filled_order(self, order):
@@ -139,7 +141,9 @@ class OrderMonitor:
         side = order.get("side", "N/A")
         order_type = order.get("orderType", "N/A")
         qty = order.get("qty", "0")
-        price = order.get("avgPrice", order.get("price", "0"))
+        # avgPrice пуст/"0", пока биржа его не посчитала — тогда берём лимитную цену
+        avg_price = order.get("avgPrice")
+        price = avg_price if avg_price and avg_price != "0" else (order.get("price") or "0")
         cumulative_qty = order.get("cumExecQty", "0")
 
         timestamp = self._get_timestamp()
@@ -171,8 +175,9 @@ class OrderMonitor:
 
     def start_monitoring(self):
         """Запуск мониторинга ордеров"""
-        print(f"[{self._get_timestamp()}] Запуск мониторинга ордеров для {self.symbol}")
-        print(f"[{self._get_timestamp()}] Подключение к {'TESTNET' if self.testnet else 'MAINNET'}")
+        ts = self._get_timestamp()
+        print(f"[{ts}] Запуск мониторинга ордеров для {self.symbol}")
+        print(f"[{ts}] Подключение к {'TESTNET' if self.testnet else 'MAINNET'}")
 
         websocket.enableTrace(False)
         self.ws = websocket.WebSocketApp(
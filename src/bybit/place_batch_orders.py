@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+Пакетное выставление ордеров одним запросом (Bybit V5, /v5/order/create-batch).
+- Работает на линейных фьючерсах (category="linear").
+- Ключи читаются из .env.
+- Биржа принимает до 20 ордеров за запрос — длинный список режется на пачки.
+- Удобно для выставления всех TP/SL сразу вместо N+M отдельных запросов.
+- Итог: печатает "SUCCESS <orderId>" или "ERROR <msg>" по каждому ордеру.
+"""
+
+import os
+import sys
+import itertools
+import secrets
+import time
+from functools import lru_cache
+from dotenv import load_dotenv
+from pybit.unified_trading import HTTP
+
+# 🔧 Параметры ордеров
+SYMBOL = "BTCUSDT"
+ORDERS = [
+    # Лимитный TP для лонга
+    {"side": "Sell", "orderType": "Limit", "qty": "0.001", "price": "120000",
+     "positionIdx": 1, "timeInForce": "GTC"},
+    # Условный рыночный SL для лонга
+    {"side": "Sell", "orderType": "Market", "qty": "0.001", "triggerPrice": "110000",
+     "triggerDirection": 2, "triggerBy": "LastPrice", "positionIdx": 1,
+     "timeInForce": "IOC"},
+]
+
+BATCH_LIMIT = 20  # максимум ордеров в одном batch-запросе для linear
+
+_LINK_ID_CTR = itertools.count()
+_LINK_ID_BASE = f"{int(time.time()):x}{secrets.token_hex(2)}"
+
+
+def _str_to_bool(v: str | None) -> bool:
+    return (v or "").strip().lower() in {"1", "true", "yes", "y", "on"}
+
+
+def _link_id(prefix: str) -> str:
+    return f"{prefix}-{_LINK_ID_BASE}{next(_LINK_ID_CTR):x}"
+
+
+@lru_cache(maxsize=None)
+def _get_http(testnet: bool, api_key: str, api_secret: str) -> HTTP:
+    return HTTP(testnet=testnet, api_key=api_key, api_secret=api_secret,
+                timeout=10_000, recv_window=5_000)
+
+
+def place_batch_orders(symbol: str, orders: list[dict]) -> list[tuple[str | None, str]]:
+    """
+    Выставляет список ордеров пачками по BATCH_LIMIT.
+
+    Args:
+        symbol: Торговая пара (например, "BTCUSDT")
+        orders: Параметры ордеров в формате Bybit (side, orderType, qty, price, ...)
+
+    Returns:
+        Список (orderId, msg) в том же порядке, что и orders.
+        Для ордера, отклонённого биржей, orderId = None, а msg — причина отказа
+
+    Ошибка одной пачки не прерывает остальные: её ордера попадают в результат
+    как (None, <причина>), а ID уже выставленных пачек сохраняются. При сетевой
+    ошибке пачка могла дойти до биржи — такие ордера стоит сверить по orderLinkId.
+
+    Raises:
+        RuntimeError: При отсутствии ключей
+    """
+    load_dotenv()
+    api_key = os.getenv("BYBIT_API_KEY")
+    api_secret = os.getenv("BYBIT_API_SECRET")
+    testnet = _str_to_bool(os.getenv("BYBIT_TESTNET"))
+
+    if not api_key or not api_secret:
+        raise RuntimeError("Нет ключей BYBIT_API_KEY/BYBIT_API_SECRET в .env")
+
+    http = _get_http(testnet, api_key, api_secret)
+
+    results_out: list[tuple[str | None, str]] = []
+    for start in range(0, len(orders), BATCH_LIMIT):
+        request = [
+            {"symbol": symbol, "orderLinkId": _link_id("batch"), **o}
+            for o in orders[start:start + BATCH_LIMIT]
+        ]
+
+        try:
+            resp = http.place_batch_order(category="linear", request=request)
+        except Exception as exc:
+            results_out.extend((None, f"Bybit API error: {exc}") for _ in request)
+            continue
+        if not isinstance(resp, dict) or resp.get("retCode") != 0:
+            err = resp.get("retMsg") if isinstance(resp, dict) else None
+            results_out.extend((None, f"Bybit API error: {err or resp}") for _ in request)
+            continue
+
+        # result.list и retExtInfo.list идут в порядке request
+        results = resp.get("result", {}).get("list") or []
+        statuses = resp.get("retExtInfo", {}).get("list") or []
+        for i in range(len(request)):
+            status = statuses[i] if i < len(statuses) else {}
+            code = status.get("code", 0)
+            msg = status.get("msg") or "OK"
+            oid = results[i].get("orderId") if i < len(results) else None
+            results_out.append((oid if code == 0 and oid else None, msg))
+
+    return results_out
+
+
+if __name__ == "__main__":
+    try:
+        for oid, msg in place_batch_orders(SYMBOL, ORDERS):
+            print(f"SUCCESS {oid}" if oid else f"ERROR {msg}")
+    except Exception as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        sys.exit(1)
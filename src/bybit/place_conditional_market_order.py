@@ -9,7 +9,10 @@
 
 import os
 import sys
-import uuid
+import itertools
+import secrets
+import time
+from functools import lru_cache
 from dotenv import load_dotenv
 from pybit.unified_trading import HTTP
 
@@ -21,9 +24,20 @@ TRIGGER_PRICE = "115500" # цена срабатывания
 TRIGGER_BY = "LastPrice" # "LastPrice", "MarkPrice" или "IndexPrice"
 TRIGGER_DIRECTION = 2    # 1 = выше триггера, 2 = ниже триггера
 
+_LINK_ID_CTR = itertools.count()
+_LINK_ID_BASE = f"{int(time.time()):x}{secrets.token_hex(2)}"
+
 def _str_to_bool(v: str | None) -> bool:
     return (v or "").strip().lower() in {"1", "true", "yes", "y", "on"}
 
+def _link_id(prefix: str) -> str:
+    return f"{prefix}-{_LINK_ID_BASE}{next(_LINK_ID_CTR):x}"
+
+@lru_cache(maxsize=None)
+def _get_http(testnet: bool, api_key: str, api_secret: str) -> HTTP:
+    return HTTP(testnet=testnet, api_key=api_key, api_secret=api_secret,
+                timeout=10_000, recv_window=5_000)
+
 def place_conditional_market_order(symbol: str, side: str, qty: str,
                                    trigger_price: str, trigger_direction: int,
                                    trigger_by: str="LastPrice") -> str:
@@ -38,8 +52,7 @@ def place_conditional_market_order(symbol: str, side: str, qty: str,
     if not api_key or not api_secret:
         raise RuntimeError("Нет ключей BYBIT_API_KEY/BYBIT_API_SECRET в .env")
 
-    http = HTTP(testnet=testnet, api_key=api_key, api_secret=api_secret,
-                timeout=10_000, recv_window=5_000)
+    http = _get_http(testnet, api_key, api_secret)
 
     resp = http.place_order(
         category="linear",
@@ -52,7 +65,7 @@ def place_conditional_market_order(symbol: str, side: str, qty: str,
         triggerBy=trigger_by,
         stopOrderType="Stop",
         timeInForce="IOC",
-        orderLinkId=f"cond-{uuid.uuid4().hex[:10]}"
+        orderLinkId=_link_id("cond")
     )
 
     if not isinstance(resp, dict) or resp.get("retCode") != 0:
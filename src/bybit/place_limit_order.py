@@ -11,7 +11,10 @@
 
 import os
 import sys
-import uuid
+import itertools
+import secrets
+import time
+from functools import lru_cache
 from dotenv import load_dotenv
 from pybit.unified_trading import HTTP
 
@@ -23,23 +26,35 @@ PRICE = "113800"  # лимитная цена
 HEDGE_SIDE = "short"  # "long" или "short" - сторона хедж-позиции
 TIME_IN_FORCE = "GTC"  # "GTC", "IOC", "FOK"
 
+_SIDE_IDX = {"long": 1, "short": 2}
+
+_LINK_ID_CTR = itertools.count()
+_LINK_ID_BASE = f"{int(time.time()):x}{secrets.token_hex(2)}"
+
 
 def _str_to_bool(v: str | None) -> bool:
     return (v or "").strip().lower() in {"1", "true", "yes", "y", "on"}
 
 
+def _link_id(prefix: str) -> str:
+    return f"{prefix}-{_LINK_ID_BASE}{next(_LINK_ID_CTR):x}"
+
+
+@lru_cache(maxsize=None)
+def _get_http(testnet: bool, api_key: str, api_secret: str) -> HTTP:
+    return HTTP(testnet=testnet, api_key=api_key, api_secret=api_secret,
+                timeout=10_000, recv_window=5_000)
+
+
 def _get_position_idx(hedge_side: str) -> int:
     """
     Преобразует строковое обозначение стороны хеджа в positionIdx.
     long -> 1, short -> 2
     """
-    hedge_side_lower = hedge_side.lower().strip()
-    if hedge_side_lower == "long":
-        return 1
-    elif hedge_side_lower == "short":
-        return 2
-    else:
+    position_idx = _SIDE_IDX.get(hedge_side.lower().strip())
+    if position_idx is None:
         raise ValueError(f"Неверная сторона хеджа: {hedge_side}. Допустимы: 'long', 'short'")
+    return position_idx
 
 
 def place_limit_order(symbol: str, side: str, qty: str, price: str,
@@ -72,8 +87,7 @@ def place_limit_order(symbol: str, side: str, qty: str, price: str,
 
     position_idx = _get_position_idx(hedge_side)
 
-    http = HTTP(testnet=testnet, api_key=api_key, api_secret=api_secret,
-                timeout=10_000, recv_window=5_000)
+    http = _get_http(testnet, api_key, api_secret)
 
     resp = http.place_order(
         category="linear",
@@ -84,7 +98,7 @@ def place_limit_order(symbol: str, side: str, qty: str, price: str,
         price=price,
         positionIdx=position_idx,
         timeInForce=time_in_force,
-        orderLinkId=f"limit-{uuid.uuid4().hex[:10]}"
+        orderLinkId=_link_id("limit")
     )
 
     if not isinstance(resp, dict) or resp.get("retCode") != 0: